@@ -18,10 +18,15 @@ Options:
   --no-highlights                 Do not highlight cells in output workbook
   --values                        Compare displayed values (default)
   --formulas                      Compare formulas instead of values
+  --jobs N                        Worker processes for comparing sheets (default: CPU count)
 
 Requires: openpyxl
   pip install openpyxl
 
+Optional: numpy (vectorized numeric comparison),
+lxml (openpyxl serializes the output workbook faster with it)
+  pip install numpy lxml
+
 Notes:
   - The output workbook is a copy of the "new" workbook with differences
     highlighted by default and a Diff_Summary sheet added.
@@ -34,9 +39,16 @@ from __future__ import annotations
 
 import argparse
 import os
+import posixpath
+import re
 import sys
-from dataclasses import dataclass
-from typing import Iterable, List, Optional, Set, Tuple
+import zipfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import lru_cache
+from hashlib import blake2b
+from itertools import islice, zip_longest
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+from xml.etree import ElementTree
 
 try:
     from openpyxl import load_workbook
@@ -44,19 +56,33 @@ try:
     from openpyxl.workbook.workbook import Workbook
     from openpyxl.styles import PatternFill
     from openpyxl.utils import get_column_letter
+    from openpyxl.worksheet.cell_range import CellRange
 except ImportError as e:
     print("Missing dependency 'openpyxl'. Install with: pip install openpyxl", file=sys.stderr)
     raise
 
+try:
+    import numpy as np
+except ImportError:
+    np = None  # optional; numeric cells are then compared one by one
+
 
 # Highlight fills
 FILL_CHANGED = PatternFill(start_color="FFE699", end_color="FFE699", fill_type="solid")  # light yellow
 FILL_ADDED = PatternFill(start_color="C6EFCE", end_color="C6EFCE", fill_type="solid")    # light green
 FILL_REMOVED = PatternFill(start_color="FFC7CE", end_color="FFC7CE", fill_type="solid")  # light red
+STATUS_FILLS = {'added': FILL_ADDED, 'removed': FILL_REMOVED, 'changed': FILL_CHANGED}
 
+# Fewer differing cells than this are cheaper to compare one by one than through numpy
+VECTORIZE_MIN_CELLS = 64
+# Differing rows are compared in blocks of this many, so a heavily edited
+# sheet never holds all of its row pairs (and their float copies) at once
+CHUNK_ROWS = 1 << 16
+# Raw XML parts are streamed from the package this many bytes at a time
+PART_CHUNK = 1 << 20
 
-@dataclass
-class DiffRecord:
+
+class DiffRecord(NamedTuple):
     sheet: str
     cell: str
     status: str  # 'added' | 'removed' | 'changed' | 'missing_sheet_new' | 'missing_sheet_base'
@@ -68,16 +94,36 @@ def is_number(x: object) -> bool:
     return isinstance(x, (int, float)) and not isinstance(x, bool)
 
 
-def normalize_str(s: Optional[str], *, trim_whitespace: bool, case_insensitive: bool) -> Optional[str]:
-    if s is None:
+class _NormalizeCache(dict):
+    """Map each string to its normalized form, computing it on first lookup."""
+
+    def __init__(self, normalize: Callable[[str], str]) -> None:
+        super().__init__()
+        self.normalize = normalize
+
+    def __missing__(self, s: str) -> str:
+        out = self[s] = self.normalize(s)
+        return out
+
+
+def make_normalizer(*, trim_whitespace: bool, case_insensitive: bool) -> Optional[Callable[[str], str]]:
+    """Return the text normalization for the given options, or None to compare text as-is.
+
+    Categorical text (fund names, tickers, ...) repeats heavily, so each distinct
+    string is normalized once per normalizer; build one per sheet to bound it.
+    """
+    if trim_whitespace and case_insensitive:
+        normalize: Callable[[str], str] = lambda s: s.strip().lower()
+    elif trim_whitespace:
+        normalize = str.strip
+    elif case_insensitive:
+        normalize = str.lower
+    else:
         return None
-    if not isinstance(s, str):
-        return s  # pass-through non-strings
-    out = s.strip() if trim_whitespace else s
-    return out.lower() if case_insensitive else out
+    return _NormalizeCache(normalize).__getitem__
 
 
-def equal_values(a: object, b: object, *, tolerance: float, trim_whitespace: bool, case_insensitive: bool) -> bool:
+def equal_values(a: object, b: object, *, tolerance: float, normalize: Optional[Callable[[str], str]] = None) -> bool:
     # Exact equality shortcut
     if a == b:
         # Handles None, identical numbers/strings/dates
@@ -92,54 +138,220 @@ def equal_values(a: object, b: object, *, tolerance: float, trim_whitespace: boo
 
     # String normalization
     if isinstance(a, str) or isinstance(b, str):
-        return normalize_str(str(a) if a is not None else None,
-                             trim_whitespace=trim_whitespace,
-                             case_insensitive=case_insensitive) == \
-               normalize_str(str(b) if b is not None else None,
-                             trim_whitespace=trim_whitespace,
-                             case_insensitive=case_insensitive)
+        if a is None or b is None:
+            return False
+        if normalize is None:
+            return str(a) == str(b)
+        return normalize(str(a)) == normalize(str(b))
 
     # Fallback to inequality
     return False
 
 
+def numeric_diff_mask(a: Any, b: Any, atol: float) -> Any:
+    """Return a bool array that is True where abs(a - b) <= atol does not hold.
+
+    NaN on either side counts as a difference. a is used as scratch space.
+    """
+    with np.errstate(invalid='ignore'):
+        np.subtract(a, b, out=a)
+        np.abs(a, out=a)
+        return ~(a <= atol)
+
+
+def candidate_cells(base_rows: List[Tuple[object, ...]],
+                    new_rows: List[Tuple[object, ...]],
+                    tolerance: float) -> List[Tuple[int, int]]:
+    """Return (row index, col index) of cells in two equal-shape row lists that may differ.
+
+    Both grids are laid out as contiguous float64 blocks (non-numeric cells
+    become NaN) and every numeric pair is checked against the tolerance in one
+    vectorized pass. Only the remaining cells (out-of-tolerance numbers, text,
+    empties, ...) are returned for the per-cell checks, in row-major order.
+    """
+    width = len(base_rows[0])
+    size = len(base_rows) * width
+    nan = float('nan')
+    try:
+        a = np.fromiter((x if type(x) in (int, float) else nan for row in base_rows for x in row), np.float64, size)
+        b = np.fromiter((x if type(x) in (int, float) else nan for row in new_rows for x in row), np.float64, size)
+    except OverflowError:
+        # An int too large for float64; leave every cell to the per-cell checks
+        return [(i, j) for i in range(len(base_rows)) for j in range(width)]
+    rows, cols = np.divmod(np.flatnonzero(numeric_diff_mask(a, b, tolerance)), width)
+    return list(zip(rows.tolist(), cols.tolist()))
+
+
+# Column letters are recomputed in base 26 on every get_column_letter call;
+# a sheet only has so many columns, so remember them
+col_letter = lru_cache(maxsize=None)(get_column_letter)
+
+
 def cell_coord(row: int, col: int) -> str:
-    return f"{get_column_letter(col)}{row}"
-
-
-def merged_non_anchors(ws: Worksheet) -> Set[Tuple[int, int]]:
-    """Return set of coordinates (row, col) that are part of merged ranges but not the top-left anchor."""
-    coords: Set[Tuple[int, int]] = set()
-    for mr in getattr(ws, 'merged_cells', []):
-        # mr is a MergedCellRange like 'A1:C3'
-        min_row, min_col, max_row, max_col = mr.min_row, mr.min_col, mr.max_row, mr.max_col
-        for r in range(min_row, max_row + 1):
-            for c in range(min_col, max_col + 1):
-                if r == min_row and c == min_col:
+    return f"{col_letter(col)}{row}"
+
+
+# <mergeCell ref="A1:C3"/>, optionally namespace-prefixed, either quote style
+MERGE_REF_RE = re.compile(rb'<(?:\w+:)?mergeCell\b[^>]*?\bref\s*=\s*["\']([^"\']+)["\']')
+# End of the cell data; <mergeCells> can only follow it
+SHEET_DATA_END_RE = re.compile(rb'</(?:\w+:)?sheetData\s*>|<(?:\w+:)?sheetData\s*/>')
+
+
+def merged_cell_ranges(ws: Worksheet) -> List[CellRange]:
+    """Return the merged ranges of a worksheet, including read-only worksheets."""
+    try:
+        return list(ws.merged_cells)
+    except AttributeError:
+        pass
+    # ReadOnlyWorksheet does not parse <mergeCells>. The element follows
+    # <sheetData>, so stream the raw sheet XML and pull the refs from its tail.
+    # This relies on openpyxl internals (the workbook's open _archive and the
+    # sheet's _worksheet_path); the public API has no way to reach the part.
+    tail = b''
+    past_data = False
+    with ws.parent._archive.open(ws._worksheet_path) as f:
+        for chunk in iter(lambda: f.read(PART_CHUNK), b''):
+            tail += chunk
+            if not past_data:
+                end = SHEET_DATA_END_RE.search(tail) if b'sheetData' in tail else None
+                if end is None:
+                    tail = tail[-32:]  # enough to catch a closing tag split across chunks
                     continue
-                coords.add((r, c))
-    return coords
+                past_data = True
+                tail = tail[end.end():]
+    return [CellRange(ref.decode('ascii')) for ref in MERGE_REF_RE.findall(tail)]
+
 
+def merged_row_spans(*worksheets: Worksheet) -> Dict[int, List[Tuple[int, int, int]]]:
+    """Index the merged ranges of the given worksheets by row.
 
-def sheet_used_bounds(ws: Worksheet) -> Tuple[int, int]:
-    """Heuristically get used bounds as (max_row, max_col)."""
-    # openpyxl's calculate_dimension returns 'A1:D10' or 'A1'
-    dim = ws.calculate_dimension()
+    Each row maps to (min_col, max_col, anchor_col) spans, where anchor_col is
+    the range's top-left column on its first row and 0 on the rows below.
+    """
+    spans: Dict[int, List[Tuple[int, int, int]]] = {}
+    for ws in worksheets:
+        for mr in merged_cell_ranges(ws):
+            for r in range(mr.min_row, mr.max_row + 1):
+                anchor_c = mr.min_col if r == mr.min_row else 0
+                spans.setdefault(r, []).append((mr.min_col, mr.max_col, anchor_c))
+    return spans
+
+
+def sheet_rows(ws: Worksheet) -> Iterable[Tuple[object, ...]]:
+    """Stream the values of every stored row, from row 1 down.
+
+    Read-only sheets would be cut off at their stored <dimension>, which
+    third-party writers often get wrong, so it is dropped and each row comes
+    back as wide as its last stored cell (missing rows may come back empty).
+    """
+    reset_dimensions = getattr(ws, 'reset_dimensions', None)
+    if reset_dimensions is not None:
+        reset_dimensions()
+    return ws.iter_rows(min_row=1, values_only=True)
+
+
+def _part_path(base_dir: str, target: str) -> str:
+    """Resolve a relationship target against the directory of its source part."""
+    if target.startswith('/'):
+        return target[1:]
+    return posixpath.normpath(posixpath.join(base_dir, target))
+
+
+def _workbook_part(zf: zipfile.ZipFile) -> str:
+    """Return the path of the workbook part, as named by _rels/.rels."""
+    root_rels = ElementTree.fromstring(zf.read('_rels/.rels'))
+    return next(_part_path('', rel.get('Target', '')) for rel in root_rels
+                if rel.get('Type', '').endswith('/officeDocument'))
+
+
+def sheet_names(path: str) -> List[str]:
+    """List a workbook's sheet names from its workbook part, without loading the workbook."""
     try:
-        if ':' in dim:
-            _, br = dim.split(':', 1)
-        else:
-            br = dim
-        # extract trailing number and leading letters
-        col_letters = ''.join([ch for ch in br if ch.isalpha()])
-        row_digits = ''.join([ch for ch in br if ch.isdigit()])
-        from openpyxl.utils.cell import column_index_from_string
-        max_col = column_index_from_string(col_letters) if col_letters else 1
-        max_row = int(row_digits or '1')
-        return max_row, max_col
-    except Exception:
-        # Fallback
-        return ws.max_row or 1, ws.max_column or 1
+        with zipfile.ZipFile(path) as zf:
+            wb_root = ElementTree.fromstring(zf.read(_workbook_part(zf)))
+        return [el.get('name') for el in wb_root.iter() if el.tag.endswith('}sheet')]
+    except (KeyError, StopIteration, zipfile.BadZipFile, ElementTree.ParseError):
+        # Unusual package layout; let openpyxl find the sheets (or report the error)
+        wb = load_workbook(path, read_only=True)
+        try:
+            return wb.sheetnames
+        finally:
+            wb.close()
+
+
+# Cell attribute t="s": the value is an index into the shared strings table
+SHARED_STRING_RE = re.compile(rb'\st=["\']s["\']')
+
+
+def _digest_part(zf: zipfile.ZipFile, name: str, h: Any) -> bool:
+    """Feed a package part to h a chunk at a time.
+
+    Returns whether the part references the shared strings table.
+    """
+    uses_sst = False
+    seam = b''  # last few bytes read, in case a match straddles chunks
+    with zf.open(name) as f:
+        for chunk in iter(lambda: f.read(PART_CHUNK), b''):
+            h.update(chunk)
+            if not uses_sst:
+                uses_sst = bool(SHARED_STRING_RE.search(seam + chunk[:8]) or SHARED_STRING_RE.search(chunk))
+                seam = (seam + chunk[-8:])[-8:]
+    return uses_sst
+
+
+def sheet_digests(path: str, sheets: Iterable[str]) -> Dict[str, bytes]:
+    """Map each of the given sheet names to a digest of the stored data its cells are read from.
+
+    Besides the raw sheet XML this covers the workbook-wide parts that change
+    how that XML decodes: the shared strings table (when the sheet references
+    it), styles (number formats decide which numbers are dates) and the 1904
+    date system flag. Returns {} if the package layout cannot be followed.
+    """
+    wanted = set(sheets)
+    if not wanted:
+        return {}
+    try:
+        with zipfile.ZipFile(path) as zf:
+            # _rels/.rels -> workbook part -> its rels -> one part per sheet
+            wb_part = _workbook_part(zf)
+            wb_dir, wb_name = posixpath.split(wb_part)
+            wb_rels = ElementTree.fromstring(zf.read(posixpath.join(wb_dir, '_rels', wb_name + '.rels')))
+            targets = {rel.get('Id'): rel for rel in wb_rels}
+
+            context = blake2b(digest_size=16)
+            wb_root = ElementTree.fromstring(zf.read(wb_part))
+            date1904 = any(el.tag.endswith('}workbookPr') and el.get('date1904') in ('1', 'true')
+                           for el in wb_root.iter())
+            context.update(b'1904' if date1904 else b'1900')
+            sst_part = None
+            for rel in wb_rels:
+                rel_type = rel.get('Type', '')
+                if rel_type.endswith('/styles'):
+                    _digest_part(zf, _part_path(wb_dir, rel.get('Target', '')), context)
+                elif rel_type.endswith('/sharedStrings'):
+                    sst_part = _part_path(wb_dir, rel.get('Target', ''))
+
+            # Hashed on first use, since sheets without text never need it
+            sst_digest: Optional[bytes] = None
+            digests: Dict[str, bytes] = {}
+            for el in wb_root.iter():
+                if not el.tag.endswith('}sheet') or el.get('name') not in wanted:
+                    continue
+                rid = next((v for k, v in el.attrib.items() if k.endswith('}id')), None)
+                if rid not in targets:
+                    continue
+                h = context.copy()
+                if _digest_part(zf, _part_path(wb_dir, targets[rid].get('Target', '')), h):
+                    if sst_digest is None:
+                        sst_hash = blake2b(digest_size=16)
+                        if sst_part is not None:
+                            _digest_part(zf, sst_part, sst_hash)
+                        sst_digest = sst_hash.digest()
+                    h.update(sst_digest)
+                digests[el.get('name')] = h.digest()
+            return digests
+    except (KeyError, StopIteration, zipfile.BadZipFile, ElementTree.ParseError):
+        return {}
 
 
 def iter_diff_cells(base_ws: Worksheet,
@@ -147,43 +359,162 @@ def iter_diff_cells(base_ws: Worksheet,
                     *,
                     tolerance: float,
                     trim_whitespace: bool,
-                    case_insensitive: bool) -> Iterable[Tuple[int, int, str]]:
-    """Yield (row, col, status) for cells that differ.
+                    case_insensitive: bool) -> Iterable[Tuple[int, int, str, object, object]]:
+    """Yield (row, col, status, old, new) for cells that differ.
     status in {'added','removed','changed'}.
     """
-    base_max_r, base_max_c = sheet_used_bounds(base_ws)
-    new_max_r, new_max_c = sheet_used_bounds(new_ws)
-    max_r = max(base_max_r, new_max_r)
-    max_c = max(base_max_c, new_max_c)
-
-    base_skip = merged_non_anchors(base_ws)
-    new_skip = merged_non_anchors(new_ws)
-
-    for r in range(1, max_r + 1):
-        for c in range(1, max_c + 1):
-            if (r, c) in base_skip or (r, c) in new_skip:
-                continue
-            a = base_ws.cell(row=r, column=c).value
-            b = new_ws.cell(row=r, column=c).value
-
-            # Normalize empties
-            a_empty = a is None or a == ''
-            b_empty = b is None or b == ''
-
-            if a_empty and b_empty:
-                continue
-
-            if a_empty and not b_empty:
-                yield r, c, 'added'
-                continue
-            if b_empty and not a_empty:
-                yield r, c, 'removed'
-                continue
-
-            if not equal_values(a, b, tolerance=tolerance,
-                                trim_whitespace=trim_whitespace,
-                                case_insensitive=case_insensitive):
-                yield r, c, 'changed'
+    # Cells covered by a merge on either side, other than its top-left anchor,
+    # are skipped
+    merged_spans = merged_row_spans(base_ws, new_ws)
+
+    # Read both grids as plain value tuples rather than looking up each cell
+    # individually
+    base_rows = sheet_rows(base_ws)
+    new_rows = sheet_rows(new_ws)
+
+    changed_rows = _changed_rows(base_rows, new_rows)
+    normalize = make_normalizer(trim_whitespace=trim_whitespace, case_insensitive=case_insensitive)
+
+    while True:
+        changed = list(islice(changed_rows, CHUNK_ROWS))
+        if not changed:
+            return
+        yield from _diff_changed_rows(changed, merged_spans, tolerance, normalize)
+
+
+def _changed_rows(base_rows: Iterable[Tuple[object, ...]],
+                  new_rows: Iterable[Tuple[object, ...]]) -> Iterable[Tuple[int, tuple, tuple]]:
+    """Yield (row, base_row, new_row) for the rows whose values are not identical."""
+    for r, (base_row, new_row) in enumerate(zip_longest(base_rows, new_rows, fillvalue=()), start=1):
+        if len(base_row) != len(new_row):
+            # Rows end at their last stored cell, which may be an empty styled
+            # one on a single side; compare them at a common width
+            if len(base_row) < len(new_row):
+                base_row = tuple(base_row) + (None,) * (len(new_row) - len(base_row))
+            else:
+                new_row = tuple(new_row) + (None,) * (len(base_row) - len(new_row))
+        # Identical rows cannot hold a difference under any comparison option:
+        # every cell pair is ==, which equal_values accepts before normalizing.
+        if base_row != new_row and (base_row or new_row):
+            yield r, base_row, new_row
+
+
+def _diff_changed_rows(changed: List[Tuple[int, tuple, tuple]],
+                       merged_spans: Dict[int, List[Tuple[int, int, int]]],
+                       tolerance: float,
+                       normalize: Optional[Callable[[str], str]]) -> Iterable[Tuple[int, int, str, object, object]]:
+    """Yield the differing cells of a block of (row, base_row, new_row) that are not equal as tuples."""
+    # Both rows of a pair are already one width; pad the block to its widest pair
+    width = max(len(base_row) for _, base_row, _ in changed)
+    changed = [(r, base_row, new_row) if len(base_row) == width else
+               (r, tuple(base_row) + (None,) * (width - len(base_row)), tuple(new_row) + (None,) * (width - len(new_row)))
+               for r, base_row, new_row in changed]
+
+    if np is not None and len(changed) * width >= VECTORIZE_MIN_CELLS:
+        cells: Iterable[Tuple[int, int]] = candidate_cells([row[1] for row in changed],
+                                                           [row[2] for row in changed],
+                                                           tolerance)
+    else:
+        cells = ((k, i) for k in range(len(changed)) for i in range(width))
+
+    for k, i in cells:
+        r, base_row, new_row = changed[k]
+        c = i + 1
+        if merged_spans and any(span_lo <= c <= span_hi and c != anchor_c
+                                for span_lo, span_hi, anchor_c in merged_spans.get(r, ())):
+            continue
+        a = base_row[i]
+        b = new_row[i]
+
+        # Normalize empties
+        a_empty = a is None or a == ''
+        b_empty = b is None or b == ''
+
+        if a_empty and b_empty:
+            continue
+
+        if a_empty and not b_empty:
+            yield r, c, 'added', a, b
+            continue
+        if b_empty and not a_empty:
+            yield r, c, 'removed', a, b
+            continue
+
+        if not equal_values(a, b, tolerance=tolerance, normalize=normalize):
+            yield r, c, 'changed', a, b
+
+
+def diff_sheet(base_ws: Worksheet,
+               new_ws: Worksheet,
+               sheet: str,
+               opts: Dict[str, Any]) -> Tuple[List[DiffRecord], List[Tuple[int, int, str]]]:
+    """Compare one sheet pair.
+
+    Returns: (diff records, (row, col, status) of each cell to highlight)
+    """
+    diffs: List[DiffRecord] = []
+    fills: List[Tuple[int, int, str]] = []
+    for r, c, status, a, b in iter_diff_cells(base_ws, new_ws, **opts):
+        diffs.append(DiffRecord(sheet=sheet, cell=cell_coord(r, c), status=status, old=a, new=b))
+        fills.append((r, c, status))
+    return diffs, fills
+
+
+# Read-only copies of both workbooks, opened once in each worker process
+_worker_books: Dict[str, Any] = {}
+
+
+def _init_worker(base_path: str, new_path: str, data_only: bool) -> None:
+    """Process pool initializer: open both workbooks for every sheet this worker compares.
+
+    They stay open for the life of the process; its archive handles are
+    released when the pool shuts the worker down.
+    """
+    _worker_books['base'] = load_workbook(base_path, data_only=data_only, read_only=True)
+    _worker_books['new'] = load_workbook(new_path, data_only=data_only, read_only=True)
+
+
+def _compare_one_sheet(sheet: str, opts: Dict[str, Any]) -> Tuple[List[DiffRecord], List[Tuple[int, int, str]]]:
+    """Process pool task: diff one sheet of the workbooks opened by _init_worker."""
+    return diff_sheet(_worker_books['base'][sheet], _worker_books['new'][sheet], sheet, opts)
+
+
+def coalesce_ranges(coords: Iterable[Tuple[int, int]]) -> List[Tuple[int, int, int, int]]:
+    """Merge (row, col) cells into rectangles (min_row, min_col, max_row, max_col).
+
+    Adjacent columns within a row are joined into runs first, then runs
+    spanning the same columns on consecutive rows are stacked.
+    """
+    runs: List[Tuple[int, int, int]] = []  # (row, min_col, max_col)
+    for r, c in sorted(coords):
+        if runs and runs[-1][0] == r and runs[-1][2] == c - 1:
+            runs[-1] = (r, runs[-1][1], c)
+        else:
+            runs.append((r, c, c))
+
+    ranges: List[Tuple[int, int, int, int]] = []
+    last_for_cols: Dict[Tuple[int, int], int] = {}  # (min_col, max_col) -> index of latest range
+    for r, c1, c2 in runs:
+        i = last_for_cols.get((c1, c2))
+        if i is not None and ranges[i][2] == r - 1:
+            ranges[i] = (ranges[i][0], c1, r, c2)
+        else:
+            last_for_cols[(c1, c2)] = len(ranges)
+            ranges.append((r, c1, r, c2))
+    return ranges
+
+
+def apply_fills(ws: Worksheet, fills: List[Tuple[int, int, str]]) -> None:
+    """Highlight (row, col, status) cells, grouped by status and filled a rectangle at a time."""
+    coords_by_status: Dict[str, List[Tuple[int, int]]] = {status: [] for status in STATUS_FILLS}
+    for r, c, status in fills:
+        coords_by_status[status].append((r, c))
+    for status, coords in coords_by_status.items():
+        fill = STATUS_FILLS[status]
+        for min_r, min_c, max_r, max_c in coalesce_ranges(coords):
+            for row in ws.iter_rows(min_row=min_r, max_row=max_r, min_col=min_c, max_col=max_c):
+                for cell in row:
+                    cell.fill = fill
 
 
 def ensure_unique_sheet_name(wb: Workbook, name: str) -> str:
@@ -205,8 +536,11 @@ def add_summary_sheet(wb_out: Workbook, diffs: List[DiffRecord]) -> None:
     headers = ["Sheet", "Cell", "Status", "Old Value", "New Value"]
     ws.append(headers)
 
+    # Records are (sheet, cell, status, old, new) tuples; values keep their own
+    # types so numbers and dates stay sortable/filterable
+    append = ws.append
     for d in diffs:
-        ws.append([d.sheet, d.cell, d.status, d.old, d.new])
+        append(d)
 
     # Basic formatting: header fill, freeze, autofilter, column widths
     from openpyxl.styles import Font
@@ -232,22 +566,24 @@ def compare_workbooks(base_path: str,
                       trim_whitespace: bool = False,
                       case_insensitive: bool = False,
                       highlight: bool = True,
-                      compare_formulas: bool = False) -> Tuple[int, int]:
+                      compare_formulas: bool = False,
+                      max_workers: Optional[int] = None) -> Tuple[int, int]:
     """Compare workbooks and write output.
 
+    max_workers caps the processes used to compare sheets (default: CPU count);
+    1 compares everything in this process.
+
     Returns: (num_sheets_compared, num_differences)
     """
-    # Read values for comparison
-    base_wb = load_workbook(base_path, data_only=not compare_formulas, read_only=False)
-    new_wb_values = load_workbook(new_path, data_only=not compare_formulas, read_only=False)
-
-    # Load a writable copy of the new workbook for output (preserve formulas/styles)
-    new_wb_out = load_workbook(new_path, data_only=False, read_only=False)
+    if max_workers is not None and max_workers < 1:
+        raise ValueError("max_workers must be at least 1")
 
     diffs: List[DiffRecord] = []
 
-    base_sheets = set(base_wb.sheetnames)
-    new_sheets = set(new_wb_values.sheetnames)
+    # Sheet lists come straight from the packages; the workbooks themselves are
+    # only loaded where they are read
+    base_sheets = set(sheet_names(base_path))
+    new_sheets = set(sheet_names(new_path))
 
     # Determine sheets to compare
     to_compare = sorted(base_sheets & new_sheets)
@@ -272,31 +608,53 @@ def compare_workbooks(base_path: str,
             continue
         diffs.append(DiffRecord(sheet=s, cell="", status="missing_sheet_base", old=None, new=None))
 
-    # Compare common sheets
-    for s in to_compare:
-        base_ws = base_wb[s]
-        new_ws_vals = new_wb_values[s]
-
-        # For output highlights, if sheet exists; otherwise skip highlights for this sheet
-        new_ws_out = new_wb_out[s] if s in new_wb_out.sheetnames else None
-
-        for r, c, status in iter_diff_cells(base_ws, new_ws_vals,
-                                            tolerance=tolerance,
-                                            trim_whitespace=trim_whitespace,
-                                            case_insensitive=case_insensitive):
-            cell = cell_coord(r, c)
-            a = base_ws.cell(row=r, column=c).value
-            b = new_ws_vals.cell(row=r, column=c).value
-            diffs.append(DiffRecord(sheet=s, cell=cell, status=status, old=a, new=b))
-
-            if highlight and new_ws_out is not None:
-                out_cell = new_ws_out.cell(row=r, column=c)
-                if status == 'added':
-                    out_cell.fill = FILL_ADDED
-                elif status == 'removed':
-                    out_cell.fill = FILL_REMOVED
-                elif status == 'changed':
-                    out_cell.fill = FILL_CHANGED
+    # Sheets stored identically in both files cannot differ; only scan the rest
+    base_digests = sheet_digests(base_path, to_compare)
+    new_digests = sheet_digests(new_path, to_compare)
+    to_scan = [s for s in to_compare if s not in base_digests or base_digests[s] != new_digests.get(s)]
+
+    # Compare common sheets. Sheets are independent, so with more than one
+    # to compare they are spread over worker processes.
+    opts: Dict[str, Any] = dict(tolerance=tolerance,
+                                trim_whitespace=trim_whitespace,
+                                case_insensitive=case_insensitive)
+    workers = min(max_workers or os.cpu_count() or 1, len(to_scan))
+    results: List[Tuple[List[DiffRecord], List[Tuple[int, int, str]]]] = [([], [])] * len(to_scan)
+
+    # Fills can only be applied here, on the single writable copy of the new
+    # workbook (loaded with formulas/styles preserved for output)
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers,
+                                 initializer=_init_worker,
+                                 initargs=(base_path, new_path, not compare_formulas)) as pool:
+            futures = {pool.submit(_compare_one_sheet, s, opts): i for i, s in enumerate(to_scan)}
+            # Load the output copy while the workers compare, then highlight
+            # each sheet as soon as its result comes back
+            new_wb_out = load_workbook(new_path, data_only=False, read_only=False)
+            for future in as_completed(futures):
+                i = futures[future]
+                results[i] = future.result()
+                if highlight:
+                    apply_fills(new_wb_out[to_scan[i]], results[i][1])
+    else:
+        new_wb_out = load_workbook(new_path, data_only=False, read_only=False)
+        if to_scan:
+            # Read both sides for comparison (streamed; never modified), as the
+            # workers do. Scanning the writable output copy instead would create
+            # a Cell for every coordinate in its used rectangle.
+            base_wb = load_workbook(base_path, data_only=not compare_formulas, read_only=True)
+            new_wb_values = load_workbook(new_path, data_only=not compare_formulas, read_only=True)
+            for i, s in enumerate(to_scan):
+                results[i] = diff_sheet(base_wb[s], new_wb_values[s], s, opts)
+                if highlight:
+                    apply_fills(new_wb_out[s], results[i][1])
+
+            # Read-only workbooks keep their source archive open until closed
+            base_wb.close()
+            new_wb_values.close()
+
+    for sheet_diffs, _ in results:
+        diffs.extend(sheet_diffs)
 
     # Add summary sheet to output workbook
     add_summary_sheet(new_wb_out, diffs)
@@ -331,8 +689,12 @@ def main(argv: Optional[List[str]] = None) -> int:
     group.add_argument('--values', dest='compare_formulas', action='store_false', help='Compare displayed values (default)')
     group.add_argument('--formulas', dest='compare_formulas', action='store_true', help='Compare formulas instead of values')
     p.set_defaults(compare_formulas=False)
+    p.add_argument('--jobs', '-j', type=int, default=None,
+                   help='Worker processes for comparing sheets (default: CPU count)')
 
     args = p.parse_args(argv)
+    if args.jobs is not None and args.jobs < 1:
+        p.error('--jobs must be at least 1')
 
     base_path = args.base
     new_path = args.new
@@ -364,6 +726,7 @@ def main(argv: Optional[List[str]] = None) -> int:
             case_insensitive=args.case_insensitive,
             highlight=(not args.no_highlights),
             compare_formulas=args.compare_formulas,
+            max_workers=args.jobs,
         )
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
@@ -6,6 +6,6 @@ data = {"Date": ["2025-01-01", "2025-01-02", "2025-01-03"],
         "Liabilities": [200000, 205000, 210000]}
 
 df = pd.DataFrame(data)
-df["NAV"] = df["Assets"] - df["Liabilities"]
+df["NAV"] = df["Assets"].to_numpy() - df["Liabilities"].to_numpy()
 
 print(df)